@@ -1,10 +1,112 @@
+import asyncio
+import atexit
 from collections import Counter
-import json
-from bs4 import BeautifulSoup
-import numpy as np
-import requests
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 from exceptions import UrlError
+import heapq
 import re
+import statistics
+import threading
+from urllib.parse import unquote, urlencode
+
+# (connect, read) timeouts in seconds for page downloads
+REQUEST_TIMEOUT = (3.05, 27)
+
+# On-disk HTTP cache shared across runs; responses expire after a day
+CACHE_NAME = 'wiki_cache'
+CACHE_EXPIRE_AFTER = 86400
+
+# Failed downloads are retried this many times, waiting RETRY_BACKOFF_FACTOR * 2 ** attempt seconds in between
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+
+# English Wikipedia articles are read as plain text through the TextExtracts API instead of as HTML;
+# Special: and Media: pages have no extract, so they keep going through the HTML path
+_WIKIPEDIA_ARTICLE_RE = re.compile(r'^https?://en\.wikipedia\.org/wiki/(?!(?i:(?:special|media)(?::|%3a)))([^?#]+)')
+_WIKIPEDIA_API_URL = 'https://en.wikipedia.org/w/api.php'
+
+# Container of the article body on Wikipedia pages
+_ARTICLE_SELECTOR = '#mw-content-text'
+
+# Runs of text between sentence-ending punctuation
+_SENT_RE = re.compile(r'[^.!?]+')
+
+# Whitespace-separated tokens, with sentence-ending punctuation treated as a separator;
+# tokens made only of '=' (wiki heading markers, equations) are never words
+_WORD_RE = re.compile(r'(?!=+(?:[\s.!?]|$))[^\s.!?]+')
+
+# Section heading lines in TextExtracts plain text: raw section markers, or wiki-style '== Heading =='
+_HEADING_RE = re.compile(r'\x01\x02\d\x02\x01|=+ .* =+$')
+
+# Prepositions and conjunctions excluded from the filtered word frequencies
+_STOPWORDS = frozenset({'and', 'or', 'but', 'in', 'on', 'at', 'with', 'for', 'the', 'a'})
+
+
+def _source_url(url: str) -> str:
+    """
+    Returns the URL to download the page content from: the plain text extract
+    endpoint for English Wikipedia articles, the page itself otherwise.
+    """
+    match = _WIKIPEDIA_ARTICLE_RE.match(url)
+    if match is None:
+        return url
+    params = {
+        'action': 'query',
+        'prop': 'extracts',
+        'explaintext': 1,
+        'exsectionformat': 'raw',
+        'redirects': 1,
+        'format': 'json',
+        'formatversion': 2,
+        'titles': unquote(match.group(1)).replace('_', ' '),
+    }
+    return f"{_WIKIPEDIA_API_URL}?{urlencode(params)}"
+
+
+async def _fetch_content(session: aiohttp.ClientSession, url: str) -> bytes:
+    """
+    Downloads the body of a single page through the given aiohttp session.
+    Connection errors, timeouts, 429 and 5xx responses are retried with exponential backoff.
+    Raises UrlError for invalid URLs.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with session.get(_source_url(url)) as response:
+                response.raise_for_status()
+                return await response.read()
+        except aiohttp.ClientResponseError as e:
+            if (e.status != 429 and e.status < 500) or attempt == MAX_RETRIES:
+                raise UrlError(url, f"Failed to fetch data: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt == MAX_RETRIES:
+                raise UrlError(url, f"Failed to fetch data: {str(e)}")
+        await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** attempt)
+
+
+async def _open_session() -> CachedSession:
+    """
+    Opens a session backed by the on-disk cache. Must be awaited on the event loop that uses the session.
+    """
+    timeout = aiohttp.ClientTimeout(sock_connect=REQUEST_TIMEOUT[0], sock_read=REQUEST_TIMEOUT[1])
+    cache = SQLiteBackend(CACHE_NAME, expire_after=CACHE_EXPIRE_AFTER)
+    return CachedSession(cache=cache, timeout=timeout)
+
+
+async def fetch_pages(urls: list) -> list:
+    """
+    Downloads all pages concurrently from a single event loop.
+
+    All pages share one connection pool, and responses are cached on disk so
+    repeated runs skip the network entirely. Returns the page bodies in the
+    order of the given URLs; pass them to RawPage(url, content=...) to parse
+    without downloading again.
+    """
+    async with await _open_session() as session:
+        return await asyncio.gather(*(_fetch_content(session, url) for url in urls))
+
 
 class RawPage:
     """
@@ -12,13 +114,19 @@ class RawPage:
 
     Attributes:
         url (str): The URL address of the article.
-        _data (str): Private attribute to store the downloaded content of the page.
+        _content (bytes): Private attribute holding an already downloaded page body, if any
+            (the extracts API JSON for English Wikipedia articles).
+        _data (LexborHTMLParser | str): Private attribute to store the parsed content of the page,
+            or its plain text for English Wikipedia articles.
         _headline (str): Private attribute to store the headline of the page.
 
     Methods:
-        __init__(self, url):
+        __init__(self, url, content=None):
             Initializes a RawPage instance with the provided URL, setting data and headline to None.
 
+        _download(cls, url: str) -> bytes:
+            Private method to download a page synchronously through the session shared by all RawPage instances.
+
         _fetch_data(self):
             Private method to fetch and populate data and headline attributes from the web page.
 
@@ -35,14 +143,22 @@ class RawPage:
         >>> print(page.headline)
         # Output: (downloads and returns page headline)
     """
-    def __init__(self, url):
+    _download_loop = None
+    _download_session = None
+    _download_lock = threading.Lock()
+
+    def __init__(self, url, content=None):
         """
         Initializes a RawPage instance with the provided URL, setting data and headline to None.
 
         Parameters:
             url (str): The URL address of the article.
+            content (bytes): Optional page body that was already downloaded, e.g. by fetch_pages.
+                When given, the page is parsed from it and never downloaded. For English Wikipedia
+                URLs this must be the TextExtracts API JSON response, not the article HTML.
         """
         self.url = url
+        self._content = content
         self._data = None
         self._headline = None
 
@@ -64,24 +180,71 @@ class RawPage:
             self._fetch_data()
         return self._headline
 
-    def _fetch_data(self):
+    @classmethod
+    def _download(cls, url: str) -> bytes:
         """
-        Private method to fetch and populate data and headline attributes from the web page.
+        Private method to download a page synchronously through the session shared by all RawPage instances.
+        The cached, retrying session lives on a background event loop created on first use, so connections
+        are reused between pages and the call also works from code that already runs an event loop.
         Raises UrlError for invalid URLs.
         """
-        try:
-            response = requests.get(self.url)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            headline_element = soup.find('h1', {'id': 'firstHeading'})
-            self._headline = headline_element.text if headline_element else "Headline not found"
+        with cls._download_lock:
+            if cls._download_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='RawPage-downloads', daemon=True).start()
+                cls._download_session = asyncio.run_coroutine_threadsafe(_open_session(), loop).result()
+                cls._download_loop = loop
+                atexit.register(cls._close_download_session)
+        return asyncio.run_coroutine_threadsafe(_fetch_content(cls._download_session, url), cls._download_loop).result()
 
-            self._data = soup
+    @classmethod
+    def _close_download_session(cls):
+        """
+        Private method closing the shared download session and stopping its event loop at interpreter exit.
+        """
+        asyncio.run_coroutine_threadsafe(cls._download_session.close(), cls._download_loop).result()
+        cls._download_loop.call_soon_threadsafe(cls._download_loop.stop)
 
-        except requests.exceptions.RequestException as e:
-            raise UrlError(self.url, f"Failed to fetch data: {str(e)}")
+    def _fetch_data(self):
+        """
+        Private method to fetch and populate data and headline attributes from the web page.
+        Pages without prefetched content are downloaded with _download.
+        Raises UrlError for invalid URLs.
+        """
+        content = self._content
+        if content is None:
+            content = self._download(self.url)
+
+        if _WIKIPEDIA_ARTICLE_RE.match(self.url):
+            try:
+                payload = orjson.loads(content)
+            except orjson.JSONDecodeError as e:
+                raise UrlError(self.url, f"Invalid extracts API response: {str(e)}")
+
+            if not isinstance(payload, dict):
+                raise UrlError(self.url, "Unexpected extracts API response: not a JSON object")
+
+            if 'error' in payload:
+                error = payload['error']
+                info = error.get('info', error) if isinstance(error, dict) else error
+                raise UrlError(self.url, f"Extracts API error: {info}")
+
+            try:
+                page = payload['query']['pages'][0]
+                if page.get('missing') or page.get('invalid'):
+                    raise UrlError(self.url, "Article not found")
+                self._data = page['extract']
+                self._headline = page['title']
+            except KeyError as e:
+                raise UrlError(self.url, f"Unexpected extracts API response: missing {str(e)}")
+            except (IndexError, TypeError, AttributeError) as e:
+                raise UrlError(self.url, f"Unexpected extracts API response: {str(e)}")
+            return
+
+        self._data = LexborHTMLParser(content)
+
+        headline_element = self._data.css_first('h1#firstHeading')
+        self._headline = headline_element.text() if headline_element else "Headline not found"
 
 class PageContent:
     """
@@ -165,6 +328,7 @@ class Extractor:
     Attributes:
         sentences (list): List to store extracted sentences.
         words (list): List to store extracted words.
+        _raw_page (RawPage): Private attribute holding the RawPage the stored sentences and words belong to.
 
     Methods:
         __init__(self):
@@ -176,6 +340,9 @@ class Extractor:
         extract_words(self, raw_page: RawPage, page_content: PageContent):
             Extracts words from the provided RawPage and sets them in the given PageContent instance.
 
+        _ensure_data(self, raw_page: RawPage):
+            Private method to extract data unless it was already extracted from the same RawPage.
+
         _fetch_data(self, raw_page: RawPage):
             Private method to fetch and populate sentences and words attributes from the RawPage.
 
@@ -196,6 +363,7 @@ class Extractor:
         """
         self.sentences = None
         self.words = None
+        self._raw_page = None
     
     def extract_sentences(self, raw_page: RawPage, page_content: PageContent):
         """
@@ -205,8 +373,7 @@ class Extractor:
             raw_page (RawPage): The RawPage instance to extract sentences from.
             page_content (PageContent): The PageContent instance to set extracted sentences.
         """
-        if self.sentences is None:
-            self._fetch_data(raw_page)
+        self._ensure_data(raw_page)
         page_content.set_sentences(self.sentences)
 
     def extract_words(self, raw_page: RawPage, page_content: PageContent):
@@ -217,10 +384,21 @@ class Extractor:
             raw_page (RawPage): The RawPage instance to extract words from.
             page_content (PageContent): The PageContent instance to set extracted words.
         """
-        if self.words is None:
-            self._fetch_data(raw_page)
+        self._ensure_data(raw_page)
         page_content.set_words(self.words)
 
+    def _ensure_data(self, raw_page: RawPage):
+        """
+        Private method to extract data unless it was already extracted from the same RawPage.
+        Sentences and words are extracted together, so the second extract call is free,
+        while reusing the extractor for another RawPage never returns stale data.
+
+        Parameters:
+            raw_page (RawPage): The RawPage instance to extract data from.
+        """
+        if raw_page is not self._raw_page:
+            self._fetch_data(raw_page)
+
     def _fetch_data(self, raw_page: RawPage):
         """
         Private method to fetch and populate sentences and words attributes from the RawPage.
@@ -228,15 +406,25 @@ class Extractor:
         Parameters:
             raw_page (RawPage): The RawPage instance to extract data from.
         """
-        # Extract text content from 'p' tags in the RawPage
-        texts = [sentence.text for sentence in raw_page.data.find_all('p')]
+        if isinstance(raw_page.data, str):
+            # Plain text has one paragraph or heading per line; headings and blank lines are dropped,
+            # and '.' keeps paragraph ends as sentence boundaries
+            joined = '.'.join(line for line in raw_page.data.splitlines()
+                              if line.strip() and not _HEADING_RE.match(line))
+        else:
+            # Only look at the article body when the page has one, skipping navigation and footer boilerplate
+            article = raw_page.data.css_first(_ARTICLE_SELECTOR) or raw_page.data
 
-        # Split text into sentences using a simple approach
-        sentence_endings = re.compile(r'[.!?]')
-        self.sentences = [sentence.strip() for text in texts for sentence in sentence_endings.split(text) if sentence.strip()]
+            # Join text content from 'p' tags in the RawPage; '.' keeps paragraph ends as sentence boundaries
+            joined = '.'.join(node.text() for node in article.css('p'))
 
-        # Populate the words attribute
-        self.words = [word for sentence in self.sentences for word in sentence.split()]
+        # Split text into sentences in a single pass over the joined text
+        self.sentences = [sentence.strip() for sentence in _SENT_RE.findall(joined) if not sentence.isspace()]
+
+        # Populate the words attribute from the same joined text instead of re-splitting each sentence
+        self.words = _WORD_RE.findall(joined)
+
+        self._raw_page = raw_page
 
 
 class PageAnalytics:
@@ -246,6 +434,7 @@ class PageAnalytics:
     Attributes:
         page_content (PageContent): The PageContent instance to be analyzed.
         analytics_data (dict): Dictionary to store the analytics results.
+        word_counts (Counter): Case-insensitive word frequencies of the page, e.g. for CorpusAnalytics.
 
     Methods:
         __init__(self, page_content):
@@ -277,6 +466,7 @@ class PageAnalytics:
         """
         self.page_content = page_content
         self.analytics_data = {}
+        self.word_counts = None
         self.make_analytics()
 
     def make_analytics(self):
@@ -285,41 +475,47 @@ class PageAnalytics:
         """
         words = self.page_content.get_words()
 
-        # Calculate the top 20 most frequent words
-        word_freq_top20 = dict(Counter(words).most_common(20))
+        # Count words case-insensitively
+        self.word_counts = Counter(map(str.lower, words))
 
-        # Filter out stopwords
-        stopwords = {'and', 'or', 'but', 'in', 'on', 'at', 'with', 'for', 'the', 'a'}
-        filtered_word_freq = {word: freq for word, freq in word_freq_top20.items() if word.lower() not in stopwords}
+        # Calculate the top 20 most frequent words; most_common already returns them sorted by frequency
+        word_freq_top20 = self.word_counts.most_common(20)
 
-        # Select the top 10 from the original dictionary
-        top_10_word_freq = dict(sorted(word_freq_top20.items(), key=lambda x: x[1], reverse=True)[:10])
+        # Select the top 10 most frequent words
+        top_10_word_freq = dict(word_freq_top20[:10])
 
         # Select the top 10 most frequent words without considering prepositions and conjunctions
-        top_10_filtered_word_freq = dict(sorted(filtered_word_freq.items(), key=lambda x: x[1], reverse=True)[:10])
+        top_10_filtered_word_freq = dict([(word, freq) for word, freq in word_freq_top20 if word not in _STOPWORDS][:10])
 
         # Save the results
         self.analytics_data['top_10_words'] = top_10_word_freq
         self.analytics_data['top_10_words_filtered'] = top_10_filtered_word_freq
 
         # Calculate average and median word length
-        word_lengths = np.array([len(word) for word in words])
-        self.analytics_data['average_word_length'] = np.mean(word_lengths)
-        self.analytics_data['median_word_length'] = np.median(word_lengths)
+        word_lengths = list(map(len, words))
+        self.analytics_data['average_word_length'] = sum(word_lengths) / len(word_lengths)
+        self.analytics_data['median_word_length'] = statistics.median(word_lengths)
 
         # Calculate the top 10 longest words
-        longest_words = sorted(words, key=len, reverse=True)[:10]
+        longest_words = heapq.nlargest(10, words, key=len)
         longest_words_dict = {word: len(word) for word in longest_words}
         self.analytics_data['top_10_longest_words'] = longest_words_dict
 
-        # Calculate average and median sentence length
+        # Collect sentence lengths and the longest sentence in a single pass
         sentences = self.page_content.get_sentences()
-        sentence_lengths = np.array([len(sentence.split()) for sentence in sentences])
-        self.analytics_data['average_sentence_length'] = np.mean(sentence_lengths)
-        self.analytics_data['median_sentence_length'] = np.median(sentence_lengths)
+        sentence_lengths = []
+        longest_sentence, longest_sentence_length = None, -1
+        for sentence in sentences:
+            length = len(sentence.split())
+            sentence_lengths.append(length)
+            if length > longest_sentence_length:
+                longest_sentence, longest_sentence_length = sentence, length
+
+        # Calculate average and median sentence length
+        self.analytics_data['average_sentence_length'] = sum(sentence_lengths) / len(sentence_lengths)
+        self.analytics_data['median_sentence_length'] = statistics.median(sentence_lengths)
         
-        # Find and store the longest sentence
-        longest_sentence = max(sentences, key=lambda sentence: len(sentence.split()))
+        # Store the longest sentence
         self.analytics_data['longest_sentence'] = longest_sentence
 
     def save_to_json(self, filename: str):
@@ -330,8 +526,8 @@ class PageAnalytics:
             filename (str): The name of the JSON file to save the analytics data.
         """
         self.analytics_data['url'] = self.page_content.url
-        with open(filename, 'w') as json_file:
-            json.dump(self.analytics_data, json_file, indent=2)
+        with open(filename, 'wb') as json_file:
+            json_file.write(orjson.dumps(self.analytics_data, option=orjson.OPT_INDENT_2))
 
     def __str__(self) -> str:
         """
@@ -348,3 +544,73 @@ class PageAnalytics:
         output += f"The longest Sentence: {self.analytics_data['longest_sentence']:.2f}\n"
         return output
 
+
+class CorpusAnalytics:
+    """
+    CorpusAnalytics class responsible for aggregating word frequencies of several pages for cross-page comparisons.
+
+    Attributes:
+        word_counts (Counter): Word frequencies summed over all added pages.
+        _page_counts (dict): Private attribute mapping each added URL to its own word frequencies.
+
+    Methods:
+        __init__(self):
+            Initializes an empty CorpusAnalytics instance.
+
+        add_page(self, url: str, word_counts: Counter):
+            Adds the word frequencies of a page, replacing earlier counts for the same URL.
+
+        top_k(self, k: int) -> list:
+            Returns the k most frequent words across all added pages.
+
+        top_k_filtered(self, k: int) -> list:
+            Returns the k most frequent words across all added pages, excluding prepositions and conjunctions.
+
+    Example:
+        >>> corpus = CorpusAnalytics()
+        >>> corpus.add_page(page_content.url, PageAnalytics(page_content).word_counts)
+        >>> print(corpus.top_k(10))
+        # Output: (10 most frequent words across the added pages)
+    """
+    def __init__(self):
+        """
+        Initializes an empty CorpusAnalytics instance.
+        """
+        self.word_counts = Counter()
+        self._page_counts = {}
+
+    def add_page(self, url: str, word_counts: Counter):
+        """
+        Adds the word frequencies of a page, replacing earlier counts for the same URL
+        so that analyzing a page twice does not count it twice.
+
+        Parameters:
+            url (str): The URL address of the page.
+            word_counts (Counter): The word frequencies of the page, e.g. PageAnalytics.word_counts.
+        """
+        previous_counts = self._page_counts.pop(url, None)
+        if previous_counts is not None:
+            self.word_counts -= previous_counts
+        # Keep a private copy so later changes to the caller's Counter cannot skew a replacement
+        page_counts = Counter(word_counts)
+        self._page_counts[url] = page_counts
+        self.word_counts.update(page_counts)
+
+    def top_k(self, k: int) -> list:
+        """
+        Returns the k most frequent words across all added pages.
+
+        Parameters:
+            k (int): The number of words to return.
+        """
+        return self.word_counts.most_common(k)
+
+    def top_k_filtered(self, k: int) -> list:
+        """
+        Returns the k most frequent words across all added pages, excluding prepositions and conjunctions.
+
+        Parameters:
+            k (int): The number of words to return.
+        """
+        return heapq.nlargest(k, ((word, freq) for word, freq in self.word_counts.items() if word not in _STOPWORDS),
+                              key=lambda x: x[1])
@@ -1,30 +1,45 @@
-import pandas as pd
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from tabulate import tabulate
 from classes import (RawPage, PageContent, 
-                     Extractor, PageAnalytics)    
+                     Extractor, PageAnalytics, CorpusAnalytics, fetch_pages)    
 
 urls = ["https://en.wikipedia.org/wiki/Quantum_computing", "https://en.wikipedia.org/wiki/Biochemistry", "https://en.wikipedia.org/wiki/Mathematical_logic"]
-analitics_data = []
 
-for url in urls:
-    page_info = RawPage(url)
+
+def process(url, content):
+    page_info = RawPage(url, content=content)
     page_content = PageContent(url)
     extractor = Extractor()
     extractor.extract_sentences(page_info, page_content)
     extractor.extract_words(page_info, page_content)
 
-    # Create PageAnalytics instance and store analytics data in a dictionary
+    # Create PageAnalytics instance and store analytics data in a dictionary,
+    # along with the word counts the parent process aggregates across pages
     page_analytics = PageAnalytics(page_content)
-    analytics_dict = {
+    return page_analytics.word_counts, {
         "URL": url,
         "Longest Sentence": page_analytics.analytics_data['longest_sentence'],
         "Longest Word": max(page_analytics.analytics_data['top_10_longest_words'], key=page_analytics.analytics_data['top_10_longest_words'].get),
         "Number of Sentences": len(page_analytics.page_content.get_sentences()),
         "Number of Words": len(page_analytics.page_content.get_words())
     }
-    analitics_data.append(analytics_dict)
 
-# Create a DataFrame for easy comparison
-df = pd.DataFrame(analitics_data)
 
-# Print the DataFrame
-print(df)
+if __name__ == '__main__':
+    # Download all pages concurrently, then parse and analyze them in separate processes
+    contents = asyncio.run(fetch_pages(urls))
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process, urls, contents))
+
+    analitics_data = []
+    corpus = CorpusAnalytics()
+    for url, (word_counts, analytics_dict) in zip(urls, results):
+        corpus.add_page(url, word_counts)
+        analitics_data.append(analytics_dict)
+
+    # Print a table for easy comparison
+    print(tabulate(analitics_data, headers='keys'))
+
+    # Print the most frequent words across all pages
+    print(tabulate(corpus.top_k_filtered(10), headers=["Word", "Frequency"]))